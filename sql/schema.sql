@@ -28,6 +28,19 @@ CREATE INDEX IF NOT EXISTS idx_analyses_users
 CREATE INDEX IF NOT EXISTS idx_analyses_created 
     ON analyses (created_at DESC);
 
+-- =============================================
+-- REDDIT POSTS TABLE
+-- Caches fetched posts per user so repeat analyses
+-- skip the Reddit API (1h TTL, survives restarts).
+-- =============================================
+CREATE TABLE IF NOT EXISTS reddit_posts (
+    username        TEXT NOT NULL,
+    posts_limit     INT NOT NULL,
+    posts_json      JSONB NOT NULL,
+    fetched_at      TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (username, posts_limit)
+);
+
 -- =============================================
 -- CACHE LOOKUP QUERY (for reference)
 -- =============================================
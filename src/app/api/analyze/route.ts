@@ -8,17 +8,28 @@
  * 4. Reddit data fetching
  * 5. Smart sampling + LLM analysis
  * 6. Database storage
- * 7. Structured JSON response
+ * 7. Structured JSON response (or an NDJSON event stream when `stream: true`)
  */
 
 import { NextRequest, NextResponse } from "next/server";
 import { z } from "zod";
 import { fetchUserPosts } from "@/lib/reddit";
-import { generateAnalysis } from "@/lib/analyzer";
-import { getCachedAnalysis, storeAnalysis, initializeDatabase } from "@/lib/db";
+import { generateAnalysis, prepareAnalyzer } from "@/lib/analyzer";
+import {
+  getCachedAnalysis,
+  storeAnalysis,
+  initializeDatabase,
+  getCachedPosts,
+  storePosts,
+} from "@/lib/db";
 import { checkRateLimit } from "@/lib/rate-limit";
 import { logger } from "@/lib/logger";
-import type { AnalysisResponse, ApiError } from "@/types";
+import type {
+  AnalysisResponse,
+  AnalysisStreamEvent,
+  ApiError,
+  RedditPost,
+} from "@/types";
 
 // Request validation schema
 const AnalyzeSchema = z.object({
@@ -34,8 +45,11 @@ const AnalyzeSchema = z.object({
     .regex(/^[a-zA-Z0-9_-]+$/, "Invalid Reddit username"),
   postsLimit: z.number().int().min(20).max(200).optional().default(50),
   samplePairs: z.number().int().min(10).max(30).optional().default(15),
+  stream: z.boolean().optional().default(false),
 });
 
+type AnalyzeBody = z.infer<typeof AnalyzeSchema>;
+
 // Database initialization flag
 let dbInitialized = false;
 
@@ -48,6 +62,271 @@ function errorResponse(
   return NextResponse.json({ error, code, details }, { status });
 }
 
+/**
+ * Fetch a user's posts, reading through the 1h posts cache when a database
+ * is configured so repeat lookups skip the Reddit API. Cache writes are not
+ * awaited here; they are pushed onto `pendingWrites` so they overlap with
+ * the LLM call and the caller settles them before finishing.
+ */
+async function getUserPosts(
+  username: string,
+  limit: number,
+  pendingWrites: Promise<void>[]
+): Promise<RedditPost[]> {
+  if (!process.env.DATABASE_URL) {
+    return fetchUserPosts(username, limit);
+  }
+
+  const cached = await getCachedPosts(username, limit);
+  if (cached) {
+    logger.info("Posts cache hit", { username, postsLimit: limit });
+    return cached;
+  }
+
+  const posts = await fetchUserPosts(username, limit);
+  pendingWrites.push(storePosts(username, limit, posts));
+  return posts;
+}
+
+/**
+ * Fetch posts, run the LLM analysis and store the result.
+ * `onEvent` receives progress steps and report deltas for streaming clients.
+ * Throws on failure; callers map the message through normalizeError().
+ */
+async function runAnalysis(
+  body: AnalyzeBody,
+  startTime: number,
+  onEvent?: (event: AnalysisStreamEvent) => void
+): Promise<AnalysisResponse> {
+  // Fetch Reddit posts for both users concurrently (I/O-bound on Reddit latency)
+  logger.info("Fetching Reddit posts", {
+    userA: body.userA,
+    userB: body.userB,
+  });
+  onEvent?.({ type: "step", step: "fetching_user_a" });
+
+  // LLM client setup runs alongside the fetches instead of after them
+  const analyzerReady = prepareAnalyzer();
+  const pendingWrites: Promise<void>[] = [];
+
+  try {
+    const [resultA, resultB] = await Promise.allSettled([
+      getUserPosts(body.userA, body.postsLimit, pendingWrites).then(
+        (posts) => {
+          onEvent?.({ type: "step", step: "fetching_user_b" });
+          return posts;
+        }
+      ),
+      getUserPosts(body.userB, body.postsLimit, pendingWrites),
+    ]);
+
+    // Check each fetch individually so failures stay attributed to their user;
+    // userA's error wins when both fail, matching the old sequential order
+    for (const [username, result] of [
+      [body.userA, resultA],
+      [body.userB, resultB],
+    ] as const) {
+      if (result.status === "rejected") {
+        logger.warn("Reddit fetch failed", {
+          username,
+          error: String(result.reason),
+        });
+      }
+    }
+    if (resultA.status === "rejected") throw resultA.reason;
+    if (resultB.status === "rejected") throw resultB.reason;
+    const postsA = resultA.value;
+    const postsB = resultB.value;
+
+    if (postsA.length === 0) {
+      throw new Error(`No public posts found for u/${body.userA}`);
+    }
+    if (postsB.length === 0) {
+      throw new Error(`No public posts found for u/${body.userB}`);
+    }
+
+    // Generate analysis
+    logger.info("Generating analysis", {
+      postsA: postsA.length,
+      postsB: postsB.length,
+      samplePairs: body.samplePairs,
+    });
+    onEvent?.({ type: "step", step: "sampling" });
+
+    await analyzerReady;
+    onEvent?.({ type: "step", step: "generating" });
+    const { report, pairsAnalyzed } = await generateAnalysis(
+      postsA,
+      postsB,
+      body.userA,
+      body.userB,
+      body.samplePairs,
+      onEvent ? (text: string) => onEvent({ type: "delta", text }) : undefined
+    );
+
+    const latencyMs = Date.now() - startTime;
+
+    // Store in database
+    let analysisId = crypto.randomUUID();
+    if (process.env.DATABASE_URL) {
+      try {
+        analysisId = await storeAnalysis({
+          userA: body.userA,
+          userB: body.userB,
+          postsFetchedA: postsA.length,
+          postsFetchedB: postsB.length,
+          pairsAnalyzed,
+          provider: "groq",
+          report,
+          latencyMs,
+        });
+      } catch (err) {
+        logger.warn("Failed to store analysis", { error: String(err) });
+      }
+    }
+
+    logger.info("Analysis complete", {
+      id: analysisId,
+      userA: body.userA,
+      userB: body.userB,
+      latencyMs,
+      postsA: postsA.length,
+      postsB: postsB.length,
+      pairsAnalyzed,
+    });
+
+    return {
+      id: analysisId,
+      userA: body.userA,
+      userB: body.userB,
+      postsFetchedA: postsA.length,
+      postsFetchedB: postsB.length,
+      pairsAnalyzed,
+      provider: "groq",
+      report,
+      latencyMs,
+      createdAt: new Date().toISOString(),
+      cached: false,
+    };
+  } finally {
+    // Post cache writes overlap the LLM call; settle them on every path so none
+    // outlives the response (and its pooled connection) on a frozen instance
+    await Promise.all(pendingWrites);
+  }
+}
+
+/**
+ * Run the analysis as a newline-delimited JSON stream of AnalysisStreamEvents,
+ * so the client sees real progress and the report as the LLM generates it.
+ */
+function streamAnalysis(
+  body: AnalyzeBody,
+  startTime: number,
+  rateRemaining: number
+): Response {
+  const encoder = new TextEncoder();
+
+  // Once the client disconnects, events are dropped but the analysis still
+  // runs to completion so its result is stored and memoized
+  let closed = false;
+
+  const stream = new ReadableStream<Uint8Array>({
+    async start(controller) {
+      const send = (event: AnalysisStreamEvent) => {
+        if (closed) return;
+        try {
+          controller.enqueue(encoder.encode(JSON.stringify(event) + "\n"));
+        } catch {
+          closed = true;
+        }
+      };
+
+      try {
+        const data = await runAnalysis(body, startTime, send);
+        send({ type: "result", data });
+      } catch (err) {
+        const { error, code, details } = normalizeError(
+          logFailure(body, startTime, err)
+        );
+        send({ type: "error", error: { error, code, details } });
+      } finally {
+        if (!closed) {
+          closed = true;
+          controller.close();
+        }
+      }
+    },
+    cancel() {
+      closed = true;
+    },
+  });
+
+  return new Response(stream, {
+    headers: {
+      "Content-Type": "application/x-ndjson",
+      "Cache-Control": "no-cache",
+      "X-Cache": "MISS",
+      "X-RateLimit-Remaining": String(rateRemaining),
+    },
+  });
+}
+
+/**
+ * Log a failed analysis and return its error message.
+ */
+function logFailure(
+  body: AnalyzeBody,
+  startTime: number,
+  err: unknown
+): string {
+  const message = err instanceof Error ? err.message : "Unknown error";
+
+  logger.error("Analysis failed", {
+    userA: body.userA,
+    userB: body.userB,
+    error: message,
+    latencyMs: Date.now() - startTime,
+  });
+
+  return message;
+}
+
+/**
+ * Normalize pipeline error messages into user-facing codes + HTTP status.
+ */
+function normalizeError(message: string): ApiError & { status: number } {
+  if (message.startsWith("No public posts")) {
+    return { error: message, code: "NO_POSTS", status: 404 };
+  }
+  if (message.includes("not found")) {
+    return { error: message, code: "USER_NOT_FOUND", status: 404 };
+  }
+  if (message.includes("private") || message.includes("suspended")) {
+    return { error: message, code: "USER_INACCESSIBLE", status: 403 };
+  }
+  if (message.includes("GROQ_API_KEY")) {
+    return {
+      error: "Analysis service is not configured",
+      code: "CONFIG_ERROR",
+      status: 503,
+    };
+  }
+  if (message.includes("Reddit auth failed")) {
+    return {
+      error: "Reddit API connection failed",
+      code: "REDDIT_AUTH_ERROR",
+      status: 503,
+    };
+  }
+
+  return {
+    error: "Analysis failed. Please try again.",
+    code: "INTERNAL_ERROR",
+    status: 500,
+    details: process.env.NODE_ENV === "development" ? message : undefined,
+  };
+}
+
 export async function POST(request: NextRequest) {
   const startTime = Date.now();
   const ip =
@@ -67,7 +346,7 @@ export async function POST(request: NextRequest) {
   }
 
   // Parse and validate request body
-  let body: z.infer<typeof AnalyzeSchema>;
+  let body: AnalyzeBody;
   try {
     const raw = await request.json();
     body = AnalyzeSchema.parse(raw);
@@ -134,134 +413,24 @@ export async function POST(request: NextRequest) {
     }
   }
 
-  try {
-    // Fetch Reddit posts for both users
-    logger.info("Fetching Reddit posts", { userA: body.userA });
-    const postsA = await fetchUserPosts(body.userA, body.postsLimit);
-
-    logger.info("Fetching Reddit posts", { userB: body.userB });
-    const postsB = await fetchUserPosts(body.userB, body.postsLimit);
-
-    if (postsA.length === 0) {
-      return errorResponse(
-        `No public posts found for u/${body.userA}`,
-        "NO_POSTS",
-        404
-      );
-    }
-    if (postsB.length === 0) {
-      return errorResponse(
-        `No public posts found for u/${body.userB}`,
-        "NO_POSTS",
-        404
-      );
-    }
-
-    // Generate analysis
-    logger.info("Generating analysis", {
-      postsA: postsA.length,
-      postsB: postsB.length,
-      samplePairs: body.samplePairs,
-    });
-
-    const { report, pairsAnalyzed } = await generateAnalysis(
-      postsA,
-      postsB,
-      body.userA,
-      body.userB,
-      body.samplePairs
-    );
-
-    const latencyMs = Date.now() - startTime;
-
-    // Store in database
-    let analysisId = crypto.randomUUID();
-    if (process.env.DATABASE_URL) {
-      try {
-        analysisId = await storeAnalysis({
-          userA: body.userA,
-          userB: body.userB,
-          postsFetchedA: postsA.length,
-          postsFetchedB: postsB.length,
-          pairsAnalyzed,
-          provider: "groq",
-          report,
-          latencyMs,
-        });
-      } catch (err) {
-        logger.warn("Failed to store analysis", { error: String(err) });
-      }
-    }
-
-    const response: AnalysisResponse = {
-      id: analysisId,
-      userA: body.userA,
-      userB: body.userB,
-      postsFetchedA: postsA.length,
-      postsFetchedB: postsB.length,
-      pairsAnalyzed,
-      provider: "groq",
-      report,
-      latencyMs,
-      createdAt: new Date().toISOString(),
-      cached: false,
-    };
+  if (body.stream) {
+    return streamAnalysis(body, startTime, rateCheck.remaining);
+  }
 
-    logger.info("Analysis complete", {
-      id: analysisId,
-      userA: body.userA,
-      userB: body.userB,
-      latencyMs,
-      postsA: postsA.length,
-      postsB: postsB.length,
-      pairsAnalyzed,
-    });
+  try {
+    const response = await runAnalysis(body, startTime);
 
     return NextResponse.json(response, {
       headers: {
         "X-Cache": "MISS",
-        "X-Latency-Ms": String(latencyMs),
+        "X-Latency-Ms": String(response.latencyMs),
         "X-RateLimit-Remaining": String(rateCheck.remaining),
       },
     });
   } catch (err) {
-    const latencyMs = Date.now() - startTime;
-    const message = err instanceof Error ? err.message : "Unknown error";
-
-    logger.error("Analysis failed", {
-      userA: body.userA,
-      userB: body.userB,
-      error: message,
-      latencyMs,
-    });
-
-    // Normalize error responses
-    if (message.includes("not found")) {
-      return errorResponse(message, "USER_NOT_FOUND", 404);
-    }
-    if (message.includes("private") || message.includes("suspended")) {
-      return errorResponse(message, "USER_INACCESSIBLE", 403);
-    }
-    if (message.includes("GROQ_API_KEY")) {
-      return errorResponse(
-        "Analysis service is not configured",
-        "CONFIG_ERROR",
-        503
-      );
-    }
-    if (message.includes("Reddit auth failed")) {
-      return errorResponse(
-        "Reddit API connection failed",
-        "REDDIT_AUTH_ERROR",
-        503
-      );
-    }
-
-    return errorResponse(
-      "Analysis failed. Please try again.",
-      "INTERNAL_ERROR",
-      500,
-      process.env.NODE_ENV === "development" ? message : undefined
+    const { error, code, status, details } = normalizeError(
+      logFailure(body, startTime, err)
     );
+    return errorResponse(error, code, status, details);
   }
 }
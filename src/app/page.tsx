@@ -1,12 +1,17 @@
 "use client";
 
 import { useState, useRef } from "react";
+import { createPortal } from "react-dom";
 import { useRouter } from "next/navigation";
 import { motion, useInView, useScroll, useTransform } from "framer-motion";
 import { Navbar } from "@/components/Navbar";
 import { Footer } from "@/components/Footer";
 import { LoadingOverlay } from "@/components/LoadingOverlay";
-import type { AnalysisStep, AnalysisResponse } from "@/types";
+import type {
+  AnalysisStep,
+  AnalysisResponse,
+  AnalysisStreamEvent,
+} from "@/types";
 
 /* ─── Animation Variants ─── */
 const EASE_OUT: [number, number, number, number] = [0.25, 0.4, 0.25, 1];
@@ -95,35 +100,57 @@ function Counter({ value, suffix = "" }: { value: string; suffix?: string }) {
   );
 }
 
-export default function Home() {
+/* ─── Reads the NDJSON event stream from POST /api/analyze ─── */
+async function readAnalysisStream(
+  body: ReadableStream<Uint8Array>,
+  onEvent: (event: AnalysisStreamEvent) => void
+): Promise<AnalysisResponse> {
+  const reader = body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let newline = buffer.indexOf("\n");
+    while (newline !== -1) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      newline = buffer.indexOf("\n");
+      if (!line) continue;
+
+      const event: AnalysisStreamEvent = JSON.parse(line);
+      if (event.type === "result") return event.data;
+      if (event.type === "error") throw new Error(event.error.error);
+      onEvent(event);
+    }
+  }
+
+  throw new Error("Analysis stream ended unexpectedly");
+}
+
+/* ─── Username form + analysis run ───
+   Owns all per-keystroke and per-token state so typing and streaming
+   re-render only this subtree, not the whole landing page. */
+function AnalyzeForm() {
   const router = useRouter();
   const [userA, setUserA] = useState("");
   const [userB, setUserB] = useState("");
   const [step, setStep] = useState<AnalysisStep>("idle");
   const [error, setError] = useState<string | null>(null);
-
-  // Parallax for the hero orb
-  const heroRef = useRef(null);
-  const { scrollYProgress } = useScroll({
-    target: heroRef,
-    offset: ["start start", "end start"],
-  });
-  const orbY = useTransform(scrollYProgress, [0, 1], [0, 150]);
-  const orbScale = useTransform(scrollYProgress, [0, 1], [1, 0.8]);
-  const orbOpacity = useTransform(scrollYProgress, [0, 0.8], [0.7, 0]);
+  const [preview, setPreview] = useState("");
 
   async function handleAnalyze(e: React.FormEvent) {
     e.preventDefault();
     if (!userA.trim() || !userB.trim()) return;
 
     setError(null);
+    setPreview("");
     setStep("fetching_user_a");
 
     try {
-      const progressTimer = setTimeout(() => setStep("fetching_user_b"), 2000);
-      const samplingTimer = setTimeout(() => setStep("sampling"), 4000);
-      const generatingTimer = setTimeout(() => setStep("generating"), 5500);
-
       const res = await fetch("/api/analyze", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
@@ -132,13 +159,10 @@ export default function Home() {
           userB: userB.trim(),
           postsLimit: 50,
           samplePairs: 15,
+          stream: true,
         }),
       });
 
-      clearTimeout(progressTimer);
-      clearTimeout(samplingTimer);
-      clearTimeout(generatingTimer);
-
       if (!res.ok) {
         const errData = await res
           .json()
@@ -148,7 +172,18 @@ export default function Home() {
         );
       }
 
-      const data: AnalysisResponse = await res.json();
+      // Cache hits come back as plain JSON; fresh analyses stream progress + report
+      const isStream = res.headers
+        .get("Content-Type")
+        ?.includes("application/x-ndjson");
+      const data: AnalysisResponse =
+        isStream && res.body
+          ? await readAnalysisStream(res.body, (event) => {
+              if (event.type === "step") setStep(event.step);
+              if (event.type === "delta")
+                setPreview((prev) => (prev + event.text).slice(-240));
+            })
+          : await res.json();
       setStep("complete");
 
       sessionStorage.setItem("analysisResult", JSON.stringify(data));
@@ -162,13 +197,122 @@ export default function Home() {
     }
   }
 
+  const running = step !== "idle" && step !== "error" && step !== "complete";
+
   return (
     <>
-      <Navbar />
+      {/* Portaled so the fixed overlay escapes the hero's stacking context */}
+      {running &&
+        createPortal(
+          <LoadingOverlay
+            step={step}
+            userA={userA}
+            userB={userB}
+            preview={preview}
+          />,
+          document.body
+        )}
+
+      <motion.form
+        onSubmit={handleAnalyze}
+        initial={{ opacity: 0, y: 20 }}
+        animate={{ opacity: 1, y: 0 }}
+        transition={{ duration: 0.7, delay: 0.6 }}
+      >
+        <div className="glass-panel rounded-2xl p-2 sm:p-4 max-w-3xl mx-auto group relative">
+          {/* Hover glow */}
+          <div className="absolute -inset-px bg-gradient-to-r from-reddit-orange/20 via-reddit-orange/5 to-reddit-orange/20 rounded-2xl opacity-0 group-hover:opacity-100 transition-opacity duration-500 pointer-events-none blur-sm"></div>
+          <div className="flex flex-col sm:flex-row gap-2 sm:gap-3 items-center relative z-10">
+            <div className="relative w-full">
+              <div className="absolute inset-y-0 left-0 pl-3 flex items-center pointer-events-none">
+                <span className="text-reddit-text-faint font-mono text-sm">
+                  u/
+                </span>
+              </div>
+              <input
+                type="text"
+                value={userA}
+                onChange={(e) => setUserA(e.target.value)}
+                className="block w-full pl-9 py-3.5 bg-reddit-dark/80 border border-reddit-border rounded-xl text-reddit-text placeholder-reddit-text-faint focus:outline-none focus:ring-2 focus:ring-reddit-orange/40 focus:border-reddit-orange/50 transition-all font-mono text-sm hover:border-reddit-border-light"
+                placeholder="first_username"
+                required
+                pattern="[a-zA-Z0-9_-]+"
+                maxLength={20}
+              />
+            </div>
+            <span className="material-symbols-outlined text-reddit-orange/50 rotate-90 sm:rotate-0 text-xl">
+              compare_arrows
+            </span>
+            <div className="relative w-full">
+              <div className="absolute inset-y-0 left-0 pl-3 flex items-center pointer-events-none">
+                <span className="text-reddit-text-faint font-mono text-sm">
+                  u/
+                </span>
+              </div>
+              <input
+                type="text"
+                value={userB}
+                onChange={(e) => setUserB(e.target.value)}
+                className="block w-full pl-9 py-3.5 bg-reddit-dark/80 border border-reddit-border rounded-xl text-reddit-text placeholder-reddit-text-faint focus:outline-none focus:ring-2 focus:ring-reddit-orange/40 focus:border-reddit-orange/50 transition-all font-mono text-sm hover:border-reddit-border-light"
+                placeholder="second_username"
+                required
+                pattern="[a-zA-Z0-9_-]+"
+                maxLength={20}
+              />
+            </div>
+            <motion.button
+              type="submit"
+              disabled={step !== "idle" && step !== "error"}
+              whileHover={{ scale: 1.02 }}
+              whileTap={{ scale: 0.97 }}
+              className="w-full sm:w-auto px-8 py-3.5 bg-reddit-orange text-white font-semibold rounded-xl hover:bg-reddit-orange-dark transition-colors whitespace-nowrap flex items-center justify-center gap-2 disabled:opacity-50 disabled:cursor-not-allowed shadow-lg shadow-reddit-orange/20 hover:shadow-reddit-orange/30"
+            >
+              Analyze
+              <span className="material-symbols-outlined text-[20px]">
+                arrow_forward
+              </span>
+            </motion.button>
+          </div>
+          <div className="mt-3 flex justify-between items-center px-2 border-t border-reddit-border/50 pt-3 relative z-10">
+            <span className="text-xs text-reddit-text-faint font-mono tracking-wide">
+              Enter two Reddit usernames to compare
+            </span>
+            <span className="text-xs text-green-500 font-mono flex items-center gap-1.5">
+              <span className="block w-1.5 h-1.5 rounded-full bg-green-500 animate-pulse"></span>
+              Ready
+            </span>
+          </div>
+        </div>
+      </motion.form>
 
-      {step !== "idle" && step !== "error" && step !== "complete" && (
-        <LoadingOverlay step={step} userA={userA} userB={userB} />
+      {/* Error display */}
+      {error && (
+        <motion.div
+          initial={{ opacity: 0, y: 10 }}
+          animate={{ opacity: 1, y: 0 }}
+          className="mt-6 max-w-3xl mx-auto p-4 rounded-xl bg-red-900/20 border border-red-500/30 text-red-300 text-sm"
+        >
+          {error}
+        </motion.div>
       )}
+    </>
+  );
+}
+
+export default function Home() {
+  // Parallax for the hero orb
+  const heroRef = useRef(null);
+  const { scrollYProgress } = useScroll({
+    target: heroRef,
+    offset: ["start start", "end start"],
+  });
+  const orbY = useTransform(scrollYProgress, [0, 1], [0, 150]);
+  const orbScale = useTransform(scrollYProgress, [0, 1], [1, 0.8]);
+  const orbOpacity = useTransform(scrollYProgress, [0, 0.8], [0.7, 0]);
+
+  return (
+    <>
+      <Navbar />
 
       {/* ═══════════════════════════════════════════════════
           HERO SECTION
@@ -279,88 +423,7 @@ export default function Home() {
           </motion.p>
 
           {/* Input Form */}
-          <motion.form
-            onSubmit={handleAnalyze}
-            initial={{ opacity: 0, y: 20 }}
-            animate={{ opacity: 1, y: 0 }}
-            transition={{ duration: 0.7, delay: 0.6 }}
-          >
-            <div className="glass-panel rounded-2xl p-2 sm:p-4 max-w-3xl mx-auto group relative">
-              {/* Hover glow */}
-              <div className="absolute -inset-px bg-gradient-to-r from-reddit-orange/20 via-reddit-orange/5 to-reddit-orange/20 rounded-2xl opacity-0 group-hover:opacity-100 transition-opacity duration-500 pointer-events-none blur-sm"></div>
-              <div className="flex flex-col sm:flex-row gap-2 sm:gap-3 items-center relative z-10">
-                <div className="relative w-full">
-                  <div className="absolute inset-y-0 left-0 pl-3 flex items-center pointer-events-none">
-                    <span className="text-reddit-text-faint font-mono text-sm">
-                      u/
-                    </span>
-                  </div>
-                  <input
-                    type="text"
-                    value={userA}
-                    onChange={(e) => setUserA(e.target.value)}
-                    className="block w-full pl-9 py-3.5 bg-reddit-dark/80 border border-reddit-border rounded-xl text-reddit-text placeholder-reddit-text-faint focus:outline-none focus:ring-2 focus:ring-reddit-orange/40 focus:border-reddit-orange/50 transition-all font-mono text-sm hover:border-reddit-border-light"
-                    placeholder="first_username"
-                    required
-                    pattern="[a-zA-Z0-9_-]+"
-                    maxLength={20}
-                  />
-                </div>
-                <span className="material-symbols-outlined text-reddit-orange/50 rotate-90 sm:rotate-0 text-xl">
-                  compare_arrows
-                </span>
-                <div className="relative w-full">
-                  <div className="absolute inset-y-0 left-0 pl-3 flex items-center pointer-events-none">
-                    <span className="text-reddit-text-faint font-mono text-sm">
-                      u/
-                    </span>
-                  </div>
-                  <input
-                    type="text"
-                    value={userB}
-                    onChange={(e) => setUserB(e.target.value)}
-                    className="block w-full pl-9 py-3.5 bg-reddit-dark/80 border border-reddit-border rounded-xl text-reddit-text placeholder-reddit-text-faint focus:outline-none focus:ring-2 focus:ring-reddit-orange/40 focus:border-reddit-orange/50 transition-all font-mono text-sm hover:border-reddit-border-light"
-                    placeholder="second_username"
-                    required
-                    pattern="[a-zA-Z0-9_-]+"
-                    maxLength={20}
-                  />
-                </div>
-                <motion.button
-                  type="submit"
-                  disabled={step !== "idle" && step !== "error"}
-                  whileHover={{ scale: 1.02 }}
-                  whileTap={{ scale: 0.97 }}
-                  className="w-full sm:w-auto px-8 py-3.5 bg-reddit-orange text-white font-semibold rounded-xl hover:bg-reddit-orange-dark transition-colors whitespace-nowrap flex items-center justify-center gap-2 disabled:opacity-50 disabled:cursor-not-allowed shadow-lg shadow-reddit-orange/20 hover:shadow-reddit-orange/30"
-                >
-                  Analyze
-                  <span className="material-symbols-outlined text-[20px]">
-                    arrow_forward
-                  </span>
-                </motion.button>
-              </div>
-              <div className="mt-3 flex justify-between items-center px-2 border-t border-reddit-border/50 pt-3 relative z-10">
-                <span className="text-xs text-reddit-text-faint font-mono tracking-wide">
-                  Enter two Reddit usernames to compare
-                </span>
-                <span className="text-xs text-green-500 font-mono flex items-center gap-1.5">
-                  <span className="block w-1.5 h-1.5 rounded-full bg-green-500 animate-pulse"></span>
-                  Ready
-                </span>
-              </div>
-            </div>
-          </motion.form>
-
-          {/* Error display */}
-          {error && (
-            <motion.div
-              initial={{ opacity: 0, y: 10 }}
-              animate={{ opacity: 1, y: 0 }}
-              className="mt-6 max-w-3xl mx-auto p-4 rounded-xl bg-red-900/20 border border-red-500/30 text-red-300 text-sm"
-            >
-              {error}
-            </motion.div>
-          )}
+          <AnalyzeForm />
 
           {/* Scroll indicator */}
           <motion.div
@@ -7,6 +7,8 @@ interface LoadingOverlayProps {
   step: AnalysisStep;
   userA: string;
   userB: string;
+  /** Tail of the report text streamed so far, shown while generating */
+  preview?: string;
 }
 
 const STEPS: { key: AnalysisStep; label: string; detail: string; icon: string }[] = [
@@ -36,7 +38,12 @@ const STEPS: { key: AnalysisStep; label: string; detail: string; icon: string }[
   },
 ];
 
-export function LoadingOverlay({ step, userA, userB }: LoadingOverlayProps) {
+export function LoadingOverlay({
+  step,
+  userA,
+  userB,
+  preview,
+}: LoadingOverlayProps) {
   const currentIndex = STEPS.findIndex((s) => s.key === step);
   const progressPct = ((currentIndex + 1) / STEPS.length) * 100;
 
@@ -162,6 +169,15 @@ export function LoadingOverlay({ step, userA, userB }: LoadingOverlayProps) {
             })}
           </div>
 
+          {/* Live tail of the streamed report */}
+          {step === "generating" && preview && (
+            <div className="mt-4 px-3 py-2 rounded-lg bg-reddit-dark/60 border border-reddit-border/50 h-16 overflow-hidden">
+              <p className="text-[10px] text-reddit-text-faint font-mono break-words leading-relaxed">
+                {preview}
+              </p>
+            </div>
+          )}
+
           {/* Bottom hint */}
           <div className="mt-5 pt-4 border-t border-reddit-border/50 text-center">
             <p className="text-[10px] text-reddit-text-faint font-mono uppercase tracking-widest">
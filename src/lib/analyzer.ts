@@ -2,126 +2,223 @@
  * Smart Sampling + LLM Analysis Module
  *
  * Port of generate_analysis() from streamlit_app.py.
- * Preserves: hybrid sampling (random + longest), 300-char truncation, exact prompt structure.
+ * Preserves: hybrid sampling (random + longest) and the social psychologist prompt,
+ * compacted to a bounded sample-text budget.
  * Enhancement: returns structured JSON instead of raw Markdown.
  */
 
-import Groq from "groq-sdk";
+import { createHash } from "crypto";
+import type Groq from "groq-sdk";
 import type { RedditPost, CompatibilityReport } from "@/types";
 
 const MODEL = "llama-3.3-70b-versatile";
+const ANALYSIS_TTL_MS = 24 * 60 * 60 * 1000;
+const ANALYSIS_CACHE_MAX_ENTRIES = 32;
 
-let _groq: Groq | null = null;
+// Post text budget shared across every sampled post, with a per-post floor
+// (the floor wins for numSamples >= 13, e.g. ~3.6K chars total at 15 pairs)
+const SAMPLE_TEXT_BUDGET = 3000;
+const MIN_POST_CHARS = 120;
 
-function getGroqClient(): Groq {
-  if (!_groq) {
-    _groq = new Groq({
-      apiKey: process.env.GROQ_API_KEY,
-    });
+type AnalysisResult = { report: CompatibilityReport; pairsAnalyzed: number };
+
+// In-process LRU memo of finished analyses, keyed on analysisKey().
+// Map iteration order is insertion order, so the first key is least recent.
+const analysisCache = new Map<string, { value: AnalysisResult; expiresAt: number }>();
+
+// Held on globalThis so the client (and its keep-alive connection to Groq)
+// survives Next.js module re-evaluation instead of being rebuilt per reload
+const globalForGroq = globalThis as typeof globalThis & {
+  _groq?: Promise<Groq>;
+};
+
+/**
+ * Lazily load groq-sdk and construct the client on first use, so requests
+ * that never reach the LLM (cache hits, validation errors) don't pay for
+ * loading the SDK. A failed load is not memoized and is retried next call.
+ */
+function getGroqClient(): Promise<Groq> {
+  if (!globalForGroq._groq) {
+    globalForGroq._groq = import("groq-sdk")
+      .then(({ default: GroqClient }) => {
+        return new GroqClient({
+          apiKey: process.env.GROQ_API_KEY,
+        });
+      })
+      .catch((err) => {
+        globalForGroq._groq = undefined;
+        throw err;
+      });
   }
-  return _groq;
+  return globalForGroq._groq;
 }
 
 /**
- * Hybrid smart sampling: 50% random + 50% longest posts.
- * Exact port of the Python logic from streamlit_app.py.
+ * Set up the LLM client ahead of generateAnalysis(), so callers can overlap
+ * provider initialization with other I/O such as the Reddit fetches.
  */
-function samplePairs(
+export async function prepareAnalyzer(): Promise<void> {
+  // Failures (including a missing key) are reported by generateAnalysis()
+  if (process.env.GROQ_API_KEY) {
+    await getGroqClient().catch(() => undefined);
+  }
+}
+
+/**
+ * Digest of everything that determines an analysis: both users, the sample
+ * budget, and which posts were fetched. Posts are identified by their sorted
+ * Reddit ids rather than their text, so hashing cost is independent of post
+ * length and a re-sort by changed scores still yields the same key.
+ */
+function analysisKey(
   postsA: RedditPost[],
   postsB: RedditPost[],
+  userA: string,
+  userB: string,
   numSamples: number
-): Array<[RedditPost, RedditPost]> {
-  // Generate all possible cross-product pairs
-  const allPairs: Array<[RedditPost, RedditPost]> = [];
-  for (const a of postsA) {
-    for (const b of postsB) {
-      allPairs.push([a, b]);
-    }
-  }
+): string {
+  // Posts cached before ids were recorded fall back to their text
+  const ids = (posts: RedditPost[]) =>
+    posts.map((post) => post.id ?? post.text).sort().join("\0");
 
-  if (allPairs.length === 0) return [];
+  return createHash("sha256")
+    .update(`${userA}\0${userB}\0${numSamples}\0`)
+    .update(ids(postsA))
+    .update("\0\0")
+    .update(ids(postsB))
+    .digest("hex");
+}
 
-  const halfSamples = Math.floor(numSamples / 2);
+/**
+ * Deterministic PRNG (mulberry32) so sampling is reproducible for a given key.
+ */
+function seededRandom(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
 
-  // Random sampling for diversity
-  const shuffled = [...allPairs].sort(() => Math.random() - 0.5);
-  const randomPairs = shuffled.slice(
-    0,
-    Math.min(halfSamples, allPairs.length)
-  );
+/**
+ * Indices of the `k` longest posts, longest first (ties keep post order).
+ * Bounded top-k selection: one pass that only keeps a k-sized window,
+ * rather than sorting every index to use the first k.
+ */
+function longestIndices(posts: RedditPost[], k: number): number[] {
+  if (k <= 0) return [];
 
-  // Longest-post sampling for substance
-  const sortedByLength = [...allPairs].sort(
-    (a, b) => b[0].text.length + b[1].text.length - (a[0].text.length + a[1].text.length)
-  );
-  const longestPairs = sortedByLength.slice(
-    0,
-    Math.min(halfSamples, allPairs.length)
-  );
+  const len = (i: number) => posts[i].text.length;
+  const top: number[] = [];
+  for (let i = 0; i < posts.length; i++) {
+    if (top.length === k && len(i) <= len(top[k - 1])) continue;
 
-  // Combine and deduplicate
-  const seen = new Set<string>();
-  const result: Array<[RedditPost, RedditPost]> = [];
+    let pos = top.length;
+    while (pos > 0 && len(top[pos - 1]) < len(i)) pos--;
+    top.splice(pos, 0, i);
+    if (top.length > k) top.pop();
+  }
+  return top;
+}
 
-  for (const pair of [...randomPairs, ...longestPairs]) {
-    const key = `${pair[0].text.slice(0, 50)}::${pair[1].text.slice(0, 50)}`;
-    if (!seen.has(key)) {
-      seen.add(key);
-      result.push(pair);
+/**
+ * Hybrid smart sampling: 50% random + 50% longest posts.
+ * Port of the Python logic from streamlit_app.py, but samples pair indices
+ * directly instead of materializing the full postsA x postsB cross product.
+ */
+function samplePairs(
+  postsA: RedditPost[],
+  postsB: RedditPost[],
+  numSamples: number,
+  random: () => number = Math.random
+): Array<[RedditPost, RedditPost]> {
+  const totalPairs = postsA.length * postsB.length;
+  if (totalPairs === 0) return [];
+
+  const k = Math.min(Math.floor(numSamples / 2), totalPairs);
+  const target = Math.min(2 * k, totalPairs);
+
+  // Pairs are tracked by index (i * postsB.length + j) so random and longest
+  // picks that overlap are only sent to the LLM once
+  const chosen = new Set<number>();
+  const result: Array<[RedditPost, RedditPost]> = [];
+  const take = (i: number, j: number) => {
+    const id = i * postsB.length + j;
+    if (!chosen.has(id)) {
+      chosen.add(id);
+      result.push([postsA[i], postsB[j]]);
     }
+  };
+  const takeRandom = () =>
+    take(
+      Math.floor(random() * postsA.length),
+      Math.floor(random() * postsB.length)
+    );
+
+  // Random sampling for diversity: k distinct pairs
+  while (result.length < k) takeRandom();
+
+  // Longest-post sampling for substance: pair the longest posts on each side
+  const topA = longestIndices(postsA, k);
+  const topB = longestIndices(postsB, k);
+  for (let n = 0; n < k; n++) {
+    take(topA[n % topA.length], topB[n % topB.length]);
   }
 
-  return result.slice(0, numSamples);
+  // Refill any overlap between the two halves with fresh random pairs
+  while (result.length < target) takeRandom();
+
+  return result;
 }
 
 /**
- * Build the analysis prompt -- exact structure from streamlit_app.py.
+ * Build the analysis prompt: social psychologist persona, bulleted post pairs,
+ * and a compact JSON schema. Each post gets an equal share of
+ * SAMPLE_TEXT_BUDGET, but never fewer than MIN_POST_CHARS.
  */
 function buildPrompt(
   pairs: Array<[RedditPost, RedditPost]>,
   userA: string,
-  userB: string
+  userB: string,
+  numSamples: number
 ): string {
-  let pairsText = "";
-  for (let i = 0; i < pairs.length; i++) {
-    const [p1, p2] = pairs[i];
-    const t1 = p1.text.length > 300 ? p1.text.slice(0, 300) + "..." : p1.text;
-    const t2 = p2.text.length > 300 ? p2.text.slice(0, 300) + "..." : p2.text;
-    pairsText += `\n**Pair ${i + 1}:**\n`;
-    pairsText += `- ${userA}: ${t1}\n`;
-    pairsText += `- ${userB}: ${t2}\n`;
-  }
-
-  return `You are an expert social psychologist analyzing Reddit users for compatibility.
+  const perPost = Math.max(
+    MIN_POST_CHARS,
+    Math.floor(SAMPLE_TEXT_BUDGET / numSamples / 2)
+  );
 
-**Users:** u/${userA} and u/${userB}
+  // Truncate each distinct post once -- the same post often appears in
+  // several pairs (random + longest overlap, short post lists)
+  const truncated = new Map<RedditPost, string>();
+  const truncate = (post: RedditPost): string => {
+    let t = truncated.get(post);
+    if (t === undefined) {
+      t =
+        post.text.length > perPost
+          ? post.text.slice(0, perPost) + "..."
+          : post.text;
+      truncated.set(post, t);
+    }
+    return t;
+  };
 
-**Sample Post Comparisons:**
-${pairsText}
+  // Collect segments and join once rather than growing a string per pair
+  const parts: string[] = [];
+  for (const [p1, p2] of pairs) {
+    parts.push(`- ${userA}: `, truncate(p1), `\n  ${userB}: `, truncate(p2), "\n");
+  }
+  const pairsText = parts.join("");
 
-**Your Task:**
-Create a comprehensive, insightful compatibility report. Respond in valid JSON format with the following structure:
-
-{
-  "overallScore": "Excellent/High/Moderate/Low/Minimal - brief justification",
-  "sharedInterests": [
-    { "title": "Interest area name", "description": "Specific examples from their posts" }
-  ],
-  "complementaryDifferences": "What differences make them interesting to each other. Not conflicts, but complementary traits.",
-  "communicationStyle": "How do they express themselves? Formal vs casual? Humorous vs serious? Data-driven vs emotional?",
-  "relationshipPotential": "What kind of connection would work best? Friendship, mentorship, collaboration, romantic, etc.",
-  "conversationStarters": [
-    "Specific engaging question 1",
-    "Specific engaging question 2",
-    "Specific engaging question 3",
-    "Specific engaging question 4",
-    "Specific engaging question 5"
-  ]
-}
+  return `You are an expert social psychologist analyzing Reddit users u/${userA} and u/${userB} for compatibility.
 
-Provide 3-5 shared interests with specific evidence from their posts.
-**Tone:** Insightful, warm, honest. Focus on genuine compatibility, not forced connections.
-**IMPORTANT:** Return ONLY valid JSON, no markdown fencing, no extra text.`;
+Sample post pairs:
+${pairsText}
+Return ONLY valid JSON (no markdown fencing, no extra text):
+{"overallScore":"Excellent/High/Moderate/Low/Minimal - brief justification","sharedInterests":[{"title":"interest area","description":"specific evidence from their posts"}],"complementaryDifferences":"complementary traits, not conflicts","communicationStyle":"formal/casual, humorous/serious, data-driven/emotional","relationshipPotential":"friendship, mentorship, collaboration, romantic, etc.","conversationStarters":["specific engaging question"]}
+Give 3-5 shared interests and exactly 5 conversationStarters. Tone: insightful, warm, honest -- genuine compatibility, not forced connections.`;
 }
 
 /**
@@ -172,41 +269,73 @@ function parseReport(raw: string): CompatibilityReport {
 /**
  * Generate compatibility analysis using smart sampling + Groq LLM.
  * Core pipeline: sample pairs -> build prompt -> call LLM -> parse response.
+ * Sampling is seeded from the inputs, so results for identical posts are
+ * memoized in-process (24h, last 32 entries) and skip the LLM call entirely.
+ * The completion is streamed; `onDelta` receives each text chunk as it arrives.
  */
 export async function generateAnalysis(
   postsA: RedditPost[],
   postsB: RedditPost[],
   userA: string,
   userB: string,
-  numSamples: number = 15
-): Promise<{ report: CompatibilityReport; pairsAnalyzed: number }> {
+  numSamples: number = 15,
+  onDelta?: (text: string) => void
+): Promise<AnalysisResult> {
   if (!process.env.GROQ_API_KEY) {
     throw new Error("GROQ_API_KEY is not configured");
   }
 
-  // Step 1: Smart sampling
-  const pairs = samplePairs(postsA, postsB, numSamples);
+  const key = analysisKey(postsA, postsB, userA, userB, numSamples);
+  const cached = analysisCache.get(key);
+  if (cached && Date.now() < cached.expiresAt) {
+    analysisCache.delete(key);
+    analysisCache.set(key, cached);
+    return cached.value;
+  }
+
+  // Step 1: Smart sampling (seeded from the key for reproducibility)
+  const random = seededRandom(parseInt(key.slice(0, 8), 16));
+  const pairs = samplePairs(postsA, postsB, numSamples, random);
 
   if (pairs.length === 0) {
     throw new Error("No post pairs available for analysis. Users may have no public posts.");
   }
 
-  // Step 2: Build prompt (exact structure from streamlit_app.py)
-  const prompt = buildPrompt(pairs, userA, userB);
+  // Step 2: Build prompt
+  const prompt = buildPrompt(pairs, userA, userB, numSamples);
 
   // Step 3: Call Groq LLM
-  const groq = getGroqClient();
-  const completion = await groq.chat.completions.create({
+  const groq = await getGroqClient();
+  const stream = await groq.chat.completions.create({
     model: MODEL,
     messages: [{ role: "user", content: prompt }],
     temperature: 0.7,
     max_tokens: 2500,
+    stream: true,
   });
 
-  const rawResponse = completion.choices[0]?.message?.content || "";
+  const chunks: string[] = [];
+  for await (const chunk of stream) {
+    const delta = chunk.choices[0]?.delta?.content;
+    if (delta) {
+      chunks.push(delta);
+      onDelta?.(delta);
+    }
+  }
+  const rawResponse = chunks.join("");
 
   // Step 4: Parse into structured report
   const report = parseReport(rawResponse);
+  const result = { report, pairsAnalyzed: pairs.length };
+
+  const now = Date.now();
+  for (const [k, entry] of analysisCache) {
+    if (entry.expiresAt <= now) analysisCache.delete(k);
+  }
+  analysisCache.set(key, { value: result, expiresAt: now + ANALYSIS_TTL_MS });
+  while (analysisCache.size > ANALYSIS_CACHE_MAX_ENTRIES) {
+    analysisCache.delete(analysisCache.keys().next().value as string);
+  }
 
-  return { report, pairsAnalyzed: pairs.length };
+  return result;
 }
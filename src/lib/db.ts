@@ -1,13 +1,14 @@
 /**
  * PostgreSQL Database Layer
  *
- * Handles connection pooling, analysis caching (24h dedup), and historical storage.
+ * Handles connection pooling, analysis caching (24h dedup), fetched-post caching
+ * (1h TTL), and historical storage.
  * Designed for Neon/Railway/Render PostgreSQL -- NOT Supabase.
  */
 
 import { Pool, type PoolClient } from "pg";
 import { v4 as uuidv4 } from "uuid";
-import type { CompatibilityReport, AnalysisResponse } from "@/types";
+import type { CompatibilityReport, AnalysisResponse, RedditPost } from "@/types";
 
 // Connection pool -- reused across requests in the same serverless instance
 let pool: Pool | null = null;
@@ -57,6 +58,14 @@ export async function initializeDatabase(): Promise<void> {
       
       CREATE INDEX IF NOT EXISTS idx_analyses_created 
         ON analyses (created_at DESC);
+
+      CREATE TABLE IF NOT EXISTS reddit_posts (
+        username TEXT NOT NULL,
+        posts_limit INT NOT NULL,
+        posts_json JSONB NOT NULL,
+        fetched_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (username, posts_limit)
+      );
     `);
   } finally {
     client.release();
@@ -169,3 +178,72 @@ export async function storeAnalysis(params: {
     client?.release();
   }
 }
+
+/**
+ * Check for a user's fetched posts from the last hour.
+ * Mirrors the 1h TTL of the original @st.cache_data on fetch_reddit_posts,
+ * but survives instance restarts. Returns null if no valid cache exists.
+ */
+export async function getCachedPosts(
+  username: string,
+  limit: number
+): Promise<RedditPost[] | null> {
+  let client: PoolClient | undefined;
+  try {
+    const db = getPool();
+    client = await db.connect();
+
+    const result = await client.query(
+      `SELECT posts_json
+       FROM reddit_posts
+       WHERE username = $1 AND posts_limit = $2
+         AND fetched_at > NOW() - INTERVAL '1 hour'`,
+      [username.toLowerCase().trim(), limit]
+    );
+
+    if (result.rows.length === 0) return null;
+    return result.rows[0].posts_json as RedditPost[];
+  } catch (error) {
+    // If DB is unavailable, continue without cache
+    console.warn("[db] Posts cache lookup failed:", error);
+    return null;
+  } finally {
+    client?.release();
+  }
+}
+
+/**
+ * Store (or refresh) a user's fetched posts, occasionally pruning expired rows
+ * so the table stays bounded to the last hour of lookups.
+ */
+export async function storePosts(
+  username: string,
+  limit: number,
+  posts: RedditPost[]
+): Promise<void> {
+  let client: PoolClient | undefined;
+  try {
+    const db = getPool();
+    client = await db.connect();
+
+    await client.query(
+      `INSERT INTO reddit_posts (username, posts_limit, posts_json)
+       VALUES ($1, $2, $3)
+       ON CONFLICT (username, posts_limit)
+       DO UPDATE SET posts_json = EXCLUDED.posts_json, fetched_at = NOW()`,
+      [username.toLowerCase().trim(), limit, JSON.stringify(posts)]
+    );
+
+    // Periodic cleanup: expired rows are never read again
+    if (Math.random() < 0.05) {
+      await client.query(
+        `DELETE FROM reddit_posts WHERE fetched_at < NOW() - INTERVAL '1 hour'`
+      );
+    }
+  } catch (error) {
+    // If DB is unavailable, log but don't fail the request
+    console.warn("[db] Posts store failed:", error);
+  } finally {
+    client?.release();
+  }
+}
@@ -14,17 +14,46 @@ interface RedditToken {
   expires_at: number;
 }
 
+// Fields read from /user/{name}/submitted and /user/{name}/comments listings
+interface RedditListingItem {
+  name: string;
+  title?: string;
+  selftext?: string;
+  body?: string;
+  score: number;
+  created_utc: number;
+  subreddit: string;
+}
+
+interface RedditListing {
+  data?: { children?: { data: RedditListingItem }[] };
+}
+
+// Reddit returns at most 100 items per listing request
+const MAX_PAGE_SIZE = 100;
+
 let cachedToken: RedditToken | null = null;
+let pendingToken: Promise<string> | null = null;
 
 /**
  * Get an OAuth2 token from Reddit using client credentials flow.
- * Tokens are cached in-memory until expiry.
+ * Tokens are cached in-memory until expiry, and concurrent callers share
+ * a single in-flight token request instead of each doing the handshake.
  */
-async function getRedditToken(): Promise<string> {
+function getRedditToken(): Promise<string> {
   if (cachedToken && Date.now() < cachedToken.expires_at) {
-    return cachedToken.access_token;
+    return Promise.resolve(cachedToken.access_token);
   }
 
+  if (!pendingToken) {
+    pendingToken = requestRedditToken().finally(() => {
+      pendingToken = null;
+    });
+  }
+  return pendingToken;
+}
+
+async function requestRedditToken(): Promise<string> {
   const clientId = process.env.REDDIT_CLIENT_ID;
   const clientSecret = process.env.REDDIT_CLIENT_SECRET;
 
@@ -57,6 +86,59 @@ async function getRedditToken(): Promise<string> {
   return cachedToken.access_token;
 }
 
+/**
+ * Fetch up to `limit` items from a user's submitted/comments listing in a
+ * single request. The analyze route caps postsLimit at 200, so each half fits
+ * in one page of MAX_PAGE_SIZE; larger limits are clamped rather than paged.
+ */
+async function fetchListing(
+  username: string,
+  kind: "submitted" | "comments",
+  limit: number,
+  headers: Record<string, string>
+): Promise<{ ok: boolean; status: number; items: RedditListingItem[] }> {
+  const pageSize = Math.min(limit, MAX_PAGE_SIZE);
+  const res = await fetch(
+    `https://oauth.reddit.com/user/${encodeURIComponent(username)}/${kind}?sort=new&limit=${pageSize}&raw_json=1`,
+    { headers }
+  );
+
+  if (!res.ok) {
+    return { ok: false, status: res.status, items: [] };
+  }
+
+  const listing: RedditListing = await res.json();
+  return {
+    ok: true,
+    status: res.status,
+    items: (listing.data?.children ?? []).map((child) => child.data),
+  };
+}
+
+/**
+ * Append listing items to `posts`, skipping texts of 10 chars or fewer.
+ */
+function collectPosts(
+  posts: RedditPost[],
+  items: RedditListingItem[],
+  type: RedditPost["type"],
+  textOf: (item: RedditListingItem) => string
+): void {
+  for (const item of items) {
+    const text = textOf(item).trim();
+    if (text.length > 10) {
+      posts.push({
+        id: item.name,
+        text,
+        type,
+        score: item.score,
+        created_utc: item.created_utc,
+        subreddit: item.subreddit,
+      });
+    }
+  }
+}
+
 /**
  * Fetch submissions and comments from a Reddit user.
  * Mirrors RedditScraper.fetch_user_posts() from reddit_scraper.py.
@@ -76,62 +158,34 @@ export async function fetchUserPosts(
   };
 
   const halfLimit = Math.floor(limit / 2);
-  const posts: RedditPost[] = [];
 
-  // Fetch submissions
-  const submissionsRes = await fetch(
-    `https://oauth.reddit.com/user/${encodeURIComponent(username)}/submitted?sort=new&limit=${halfLimit}&raw_json=1`,
-    { headers }
-  );
+  // Submissions and comments are independent listings -- fetch them concurrently
+  const [submissions, comments] = await Promise.all([
+    fetchListing(username, "submitted", halfLimit, headers),
+    fetchListing(username, "comments", halfLimit, headers),
+  ]);
 
-  if (!submissionsRes.ok) {
-    if (submissionsRes.status === 404) {
+  if (!submissions.ok) {
+    if (submissions.status === 404) {
       throw new Error(`User u/${username} not found`);
     }
-    if (submissionsRes.status === 403) {
+    if (submissions.status === 403) {
       throw new Error(`User u/${username} profile is private or suspended`);
     }
     throw new Error(
-      `Failed to fetch submissions for u/${username}: ${submissionsRes.status}`
+      `Failed to fetch submissions for u/${username}: ${submissions.status}`
     );
   }
 
-  const submissionsData = await submissionsRes.json();
-  for (const child of submissionsData.data?.children ?? []) {
-    const s = child.data;
-    const text = `${s.title}. ${s.selftext || ""}`.trim();
-    if (text && text.length > 10) {
-      posts.push({
-        text,
-        type: "submission",
-        score: s.score,
-        created_utc: s.created_utc,
-        subreddit: s.subreddit,
-      });
-    }
-  }
-
-  // Fetch comments
-  const commentsRes = await fetch(
-    `https://oauth.reddit.com/user/${encodeURIComponent(username)}/comments?sort=new&limit=${halfLimit}&raw_json=1`,
-    { headers }
+  const posts: RedditPost[] = [];
+  collectPosts(
+    posts,
+    submissions.items,
+    "submission",
+    (s) => `${s.title}. ${s.selftext || ""}`
   );
-
-  if (commentsRes.ok) {
-    const commentsData = await commentsRes.json();
-    for (const child of commentsData.data?.children ?? []) {
-      const c = child.data;
-      const text = (c.body || "").trim();
-      if (text && text.length > 10) {
-        posts.push({
-          text,
-          type: "comment",
-          score: c.score,
-          created_utc: c.created_utc,
-          subreddit: c.subreddit,
-        });
-      }
-    }
+  if (comments.ok) {
+    collectPosts(posts, comments.items, "comment", (c) => c.body || "");
   }
 
   // Sort by score descending (most popular first)
@@ -1,6 +1,7 @@
 // Shared types for the Semantic Compatibility Engine
 
 export interface RedditPost {
+  id?: string; // Reddit fullname, e.g. t3_abc123 (submission) or t1_def456 (comment)
   text: string;
   type: "submission" | "comment";
   score: number;
@@ -13,6 +14,7 @@ export interface AnalysisRequest {
   userB: string;
   postsLimit?: number;
   samplePairs?: number;
+  stream?: boolean;
 }
 
 export interface CompatibilityReport {
@@ -68,3 +70,10 @@ export type AnalysisStep =
   | "generating"
   | "complete"
   | "error";
+
+// Newline-delimited events sent by POST /api/analyze when `stream: true`
+export type AnalysisStreamEvent =
+  | { type: "step"; step: AnalysisStep }
+  | { type: "delta"; text: string }
+  | { type: "result"; data: AnalysisResponse }
+  | { type: "error"; error: ApiError };